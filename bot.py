@@ -2,14 +2,17 @@
 
 import asyncio
 import logging
+import time
 from telegram import Bot
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 
 from config import (
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID,
     SCAN_INTERVAL,
     BOOST_AMOUNTS,
+    BOOST_AMOUNTS_SET,
     CACHE_CLEANUP_INTERVAL,
 )
 from scanner import DexScreenerScanner
@@ -24,6 +27,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Startup banner, built once at import time from static config values
+STARTUP_MSG = (
+    "🤖 <b>DexScreener Boost Bot Started!</b>\n\n"
+    f"<b>Monitoring:</b> {', '.join(str(a) + '⚡' for a in BOOST_AMOUNTS)}\n"
+    f"<b>Scan Interval:</b> {SCAN_INTERVAL} seconds\n\n"
+    "Standing by for boost purchases... ⚡"
+)
+
+
+# --------------------------------------------------------------------------- #
+# TokenBucket
+# --------------------------------------------------------------------------- #
+class TokenBucket:
+    """
+    Simple asyncio token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers ``await acquire()`` before each rate-limited operation; if the
+    bucket is short, the caller sleeps just long enough for the missing
+    tokens to refill, rather than a fixed pause.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Parameters
+        ----------
+        rate : float
+            Refill rate in tokens per second.
+        capacity : float
+            Maximum number of tokens the bucket can hold (burst size).
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, n=1):
+        """
+        Take ``n`` tokens from the bucket, sleeping until enough have
+        refilled if the bucket is currently short.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of tokens to take. Defaults to 1.
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= n
+
 
 # --------------------------------------------------------------------------- #
 # DexBoostBot
@@ -43,15 +105,30 @@ class DexBoostBot:
         """
         Initialise the bot.
 
-        * Create a :class:`telegram.Bot` instance using the configured token.
+        * Create a :class:`telegram.Bot` instance using the configured token
+          and a shared HTTP/2 connection pool for all sends.
         * Instantiate the scanner and formatter helpers.
         * Build a statistics dictionary keyed by the target boost amounts.
         """
-        self.bot = Bot(token=TELEGRAM_BOT_TOKEN)
+        request = HTTPXRequest(
+            connection_pool_size=16,
+            http_version="2",
+            connect_timeout=5,
+            read_timeout=10,
+            pool_timeout=1,
+        )
+        self.bot = Bot(token=TELEGRAM_BOT_TOKEN, request=request)
         self.scanner = DexScreenerScanner()
         self.formatter = MessageFormatter()
         self.boost_stats = {amount: 0 for amount in BOOST_AMOUNTS}
 
+        # Bound concurrent Telegram sends and serialize stats updates
+        self._tg_sem = asyncio.Semaphore(5)
+        self._tg_lock = asyncio.Lock()
+
+        # Pace sends against Telegram's ~30 msg/s budget with a small burst
+        self.bucket = TokenBucket(rate=30, capacity=20)
+
         logger.info("🤖 DexScreener Boost Bot Initialized")
         logger.info(f"Monitoring boost amounts: {BOOST_AMOUNTS}")
 
@@ -73,13 +150,13 @@ class DexBoostBot:
             ``True`` if ``boost_data['amount']`` is in ``BOOST_AMOUNTS``.
         """
         amount = boost_data.get("amount", 0)
-        return amount in BOOST_AMOUNTS
+        return amount in BOOST_AMOUNTS_SET
 
     async def send_alert(self, message):
         """
         Send a single alert message to Telegram.
 
-        The message is sent using Markdown formatting and will *not*
+        The message is sent using HTML formatting and will *not*
         suppress web‑page previews.
 
         Parameters
@@ -94,10 +171,11 @@ class DexBoostBot:
             ``False`` otherwise (logged internally).
         """
         try:
+            await self.bucket.acquire()
             await self.bot.send_message(
                 chat_id=TELEGRAM_CHAT_ID,
                 text=message,
-                parse_mode=ParseMode.MARKDOWN,
+                parse_mode=ParseMode.HTML,
                 disable_web_page_preview=False,
             )
             return True
@@ -105,14 +183,14 @@ class DexBoostBot:
             logger.error(f"Failed to send alert: {e}")
             return False
 
-    async def process_boost(self, boost):
+    async def process_boost(self, boost, token_data=None):
         """
         Process a single boost event and send an alert if appropriate.
 
         The workflow is:
 
         1. Extract the token address and amount.
-        2. Retrieve cached token metadata.
+        2. Use the prefetched token metadata, or fetch it if absent.
         3. Format the alert text.
         4. Send the alert.
         5. Update statistics.
@@ -121,6 +199,10 @@ class DexBoostBot:
         ----------
         boost : dict
             The boost record from DexScreener.
+        token_data : dict, optional
+            Prefetched pair data for the boosted token, typically obtained
+            via the scanner's bulk lookup. If omitted, the token details
+            are fetched individually.
 
         Returns
         -------
@@ -133,8 +215,9 @@ class DexBoostBot:
 
             logger.info(f"Processing {amount}⚡ boost for {token_address}")
 
-            # Get token details (may hit cache or API)
-            token_data = self.scanner.get_token_details(token_address)
+            # Fall back to a single lookup if no prefetched data was given
+            if token_data is None:
+                token_data = await self.scanner.get_token_details(token_address)
 
             # Format the message that will be sent
             message = self.formatter.format_boost_message(boost, token_data)
@@ -147,7 +230,8 @@ class DexBoostBot:
             success = await self.send_alert(message)
 
             if success:
-                self.boost_stats[amount] += 1
+                async with self._tg_lock:
+                    self.boost_stats[amount] += 1
                 logger.info(f"✅ Alert sent for {amount}⚡ boost")
                 return True
 
@@ -157,6 +241,26 @@ class DexBoostBot:
             logger.error(f"Error processing boost: {e}")
             return False
 
+    async def _guarded_process(self, boost, token_data=None):
+        """
+        Run :meth:`process_boost` under the Telegram send semaphore so that
+        at most five boosts are being processed/sent concurrently.
+
+        Parameters
+        ----------
+        boost : dict
+            The boost record from DexScreener.
+        token_data : dict, optional
+            Prefetched pair data for the boosted token.
+
+        Returns
+        -------
+        bool
+            The result of :meth:`process_boost`.
+        """
+        async with self._tg_sem:
+            return await self.process_boost(boost, token_data)
+
     async def scan_and_process(self):
         """
         Perform one scan cycle: fetch new boosts, filter, and process them.
@@ -169,7 +273,7 @@ class DexBoostBot:
         logger.info("🔍 Scanning for new boosts...")
 
         # Retrieve raw boost data
-        boosts = self.scanner.get_boosted_tokens()
+        boosts = await self.scanner.get_boosted_tokens()
 
         if not boosts:
             logger.info("No new boosts found")
@@ -184,14 +288,20 @@ class DexBoostBot:
 
         logger.info(f"Found {len(target_boosts)} matching boosts")
 
-        # Process each matching boost sequentially
-        processed_count = 0
-        for boost in target_boosts:
-            success = await self.process_boost(boost)
-            if success:
-                processed_count += 1
-                await asyncio.sleep(1)  # brief pause between messages
+        # Prefetch details for all boosted tokens in as few requests as possible
+        addresses = [b.get("tokenAddress") for b in target_boosts if b.get("tokenAddress")]
+        token_details = await self.scanner.get_token_details_bulk(addresses)
 
+        # Process all matching boosts concurrently, bounded by the semaphore
+        results = await asyncio.gather(
+            *(
+                self._guarded_process(boost, token_details.get(boost.get("tokenAddress")))
+                for boost in target_boosts
+            ),
+            return_exceptions=True,
+        )
+
+        processed_count = sum(1 for result in results if result is True)
         return processed_count
 
     # --------------------------------------------------------------------- #
@@ -214,19 +324,15 @@ class DexBoostBot:
         """
         logger.info("🚀 Starting DexScreener Boost Bot...")
 
+        # Warm up the shared Telegram connection pool
+        await self.bot.initialize()
+
         # Startup notification
         try:
-            startup_msg = (
-                "🤖 **DexScreener Boost Bot Started!**\n\n"
-                f"**Monitoring:** {', '.join(str(a) + '⚡' for a in BOOST_AMOUNTS)}\n"
-                f"**Scan Interval:** {SCAN_INTERVAL} seconds\n\n"
-                "Standing by for boost purchases... ⚡"
-            )
-
             await self.bot.send_message(
                 chat_id=TELEGRAM_CHAT_ID,
-                text=startup_msg,
-                parse_mode=ParseMode.MARKDOWN,
+                text=STARTUP_MSG,
+                parse_mode=ParseMode.HTML,
             )
             logger.info("✅ Startup message sent")
         except Exception as e:
@@ -259,17 +365,14 @@ class DexBoostBot:
 
         except KeyboardInterrupt:
             logger.info("\n👋 Received KeyboardInterrupt")
-        except Exception as e:
-            logger.error(f"Unexpected error in main loop: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error in main loop")
 
         # Shutdown notification
         try:
             shutdown_msg = (
-                "🤖 **DexScreener Boost Bot Stopped**\n\n"
-                f"**Final Statistics:**\n"
+                "🤖 <b>DexScreener Boost Bot Stopped</b>\n\n"
+                f"<b>Final Statistics:</b>\n"
                 f"• Total scans: {scan_count}\n"
                 f"• Total alerts: {total_alerts}\n"
                 f"• Boost breakdown: {self.boost_stats}\n\n"
@@ -279,12 +382,16 @@ class DexBoostBot:
             await self.bot.send_message(
                 chat_id=TELEGRAM_CHAT_ID,
                 text=shutdown_msg,
-                parse_mode=ParseMode.MARKDOWN,
+                parse_mode=ParseMode.HTML,
             )
             logger.info("✅ Shutdown message sent")
         except Exception as e:
             logger.error(f"Failed to send shutdown message: {e}")
 
+        # Drain the Telegram and scanner HTTP connection pools
+        await self.bot.shutdown()
+        await self.scanner.close()
+
         logger.info("Bot stopped gracefully")
 
 # --------------------------------------------------------------------------- #
@@ -323,6 +430,4 @@ if __name__ == "__main__":
         print("\n👋 Bot stopped by user")
     except Exception as e:
         print(f"\n❌ Bot crashed: {e}")
-        import traceback
-
-        traceback.print_exc()
\ No newline at end of file
+        logger.exception("Bot crashed")
\ No newline at end of file
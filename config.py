@@ -9,7 +9,8 @@ TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 # Scan Configuration
 SCAN_INTERVAL = 10  # seconds between scans
-BOOST_AMOUNTS = [500, 100]
+BOOST_AMOUNTS = (500, 100)  # ordered, for display
+BOOST_AMOUNTS_SET = frozenset(BOOST_AMOUNTS)  # O(1) membership checks
 TARGET_CHAIN = "solana"
 
 # DexScreener API URLs
@@ -19,4 +20,6 @@ SEARCH_API_URL = "https://api.dexscreener.com/latest/dex/search"
 
 # Cache Settings
 MAX_CACHED_BOOSTS = 500
-CACHE_CLEANUP_INTERVAL = 10  # scans
\ No newline at end of file
+CACHE_CLEANUP_INTERVAL = 10  # scans
+TOKEN_DETAILS_CACHE_SIZE = 1024
+TOKEN_DETAILS_CACHE_TTL = 45  # seconds
\ No newline at end of file
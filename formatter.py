@@ -22,15 +22,65 @@ The module relies on the :data:`config.TARGET_CHAIN` constant to build
 the DexScreener URL.
 """
 
+import html
 import logging
-from datetime import datetime
+import math
+import time
 from typing import Optional, Dict
-import traceback
 from config import TARGET_CHAIN
 
 logger = logging.getLogger(__name__)
 
 
+def _safe_float(value, default: float = 0.0) -> float:
+    """
+    Coerce an API value to float, tolerating None and malformed strings.
+
+    Parameters
+    ----------
+    value
+        The raw value from the API payload.
+    default: float
+        Value returned when coercion fails.
+
+    Returns
+    -------
+    float
+        The coerced value, or ``default``.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# Constant part of the DexScreener pair URL, built once at import time
+_DEXSCREENER_PREFIX = f"https://dexscreener.com/{TARGET_CHAIN}/"
+
+# Boost alert template, built once at import time. Uses Telegram HTML tags
+# so user-controlled token names/symbols cannot break the parser the way
+# legacy Markdown can; dynamic fields are escaped at format time.
+_TEMPLATE = """
+🚨 <b>DETECTED Boost {boost_display}</b>
+
+<b>Token:</b> {token_name} (${token_symbol})
+<b>CA:</b> <code>{token_address}</code>
+<b>Platform:</b> {platform}
+
+📊 <b>Market Data</b>
+• <b>Age:</b> {age}
+• <b>Market Cap:</b> ${market_cap:,.0f}
+• <b>Price:</b> {price_str}
+• <b>Liquidity:</b> ${liquidity_usd:,.0f} ({liquidity_percentage:.1f}%)
+
+📈 <b>Transactions</b>
+• <b>5m:</b> {buys_5m} buys | {sells_5m} sells
+• <b>24h:</b> {buys_24h} buys | {sells_24h} sells
+
+🔗 <a href="{dexscreener_url}">DexScreener</a>
+"""
+
+
 class MessageFormatter:
     """
     Helper class that formats various pieces of token and boost data.
@@ -70,17 +120,16 @@ class MessageFormatter:
             price_str = f"${price_usd:.8f}"
             price_str = price_str.rstrip("0").rstrip(".")
 
-            # Add subscript for extremely small numbers
-            if price_usd < 0.000001:
-                try:
-                    # Attempt to detect scientific notation exponent
-                    exp = -int(str(price_usd).split("e-")[-1]) if "e-" in str(price_usd) else 0
-                    if exp > 6:
-                        base_num = price_usd * (10 ** exp)
-                        zeros = "₀" * (exp - 1)
-                        return f"$0.{zeros}{base_num:.{min(6, exp)}f}".replace("0.", "")
-                except Exception:
-                    pass
+            # Add subscript for extremely small numbers; the positive guard
+            # keeps log10 from raising on bad input
+            if 0 < price_usd < 0.000001:
+                # Decimal exponent of the leading significant digit
+                exp = -math.floor(math.log10(price_usd))
+                if exp > 6:
+                    base_num = price_usd * (10 ** exp)
+                    zeros = "₀" * (exp - 1)
+                    digits = f"{base_num:.4f}".replace(".", "").rstrip("0")
+                    return f"$0.{zeros}{digits}"
             return price_str
 
         if price_usd < 1:
@@ -110,14 +159,13 @@ class MessageFormatter:
             return "N/A"
 
         try:
-            created_time = datetime.fromtimestamp(pair_created_at / 1000)
-            age_diff = datetime.now() - created_time
-
-            hours = age_diff.seconds // 3600
-            minutes = (age_diff.seconds % 3600) // 60
+            age_s = int(time.time() - pair_created_at / 1000)
+            days, rem = divmod(age_s, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
 
-            if age_diff.days > 0:
-                return f"{age_diff.days}d {hours}h"
+            if days > 0:
+                return f"{days}d {hours}h"
             if hours > 0:
                 return f"{hours}h {minutes}m"
             if minutes > 0:
@@ -170,23 +218,25 @@ class MessageFormatter:
             buys_5m = sells_5m = buys_24h = sells_24h = 0
 
             if token_data:
-                base_token = token_data.get("baseToken", {})
+                # Destructure each nested section once instead of chaining
+                # .get() calls per field
+                base_token = token_data.get("baseToken") or {}
                 token_name = base_token.get("name", "N/A")
                 token_symbol = base_token.get("symbol", "N/A")
 
-                price_usd = float(token_data.get("priceUsd", 0))
-                market_cap = float(token_data.get("marketCap", 0))
-                liquidity = token_data.get("liquidity", {})
-                liquidity_usd = float(liquidity.get("usd", 0))
+                price_usd = _safe_float(token_data.get("priceUsd"))
+                market_cap = _safe_float(token_data.get("marketCap"))
+                liquidity_usd = _safe_float(
+                    (token_data.get("liquidity") or {}).get("usd")
+                )
 
-                txns = token_data.get("txns", {})
-                buys_5m = txns.get("m5", {}).get("buys", 0)
-                sells_5m = txns.get("m5", {}).get("sells", 0)
-                buys_24h = txns.get("h24", {}).get("buys", 0)
-                sells_24h = txns.get("h24", {}).get("sells", 0)
+                txns = token_data.get("txns") or {}
+                m5 = txns.get("m5") or {}
+                h24 = txns.get("h24") or {}
+                buys_5m, sells_5m = m5.get("buys", 0), m5.get("sells", 0)
+                buys_24h, sells_24h = h24.get("buys", 0), h24.get("sells", 0)
 
-                pair_created_at = token_data.get("pairCreatedAt")
-                age = MessageFormatter.format_age(pair_created_at)
+                age = MessageFormatter.format_age(token_data.get("pairCreatedAt"))
 
             price_str = MessageFormatter.format_price(price_usd)
 
@@ -207,33 +257,27 @@ class MessageFormatter:
                     dex_id = token_data.get("dexId", "").lower()
                 platform = dex_id.capitalize() if token_data else "N/A"
 
-            dexscreener_url = f"https://dexscreener.com/{TARGET_CHAIN}/{token_address}"
+            dexscreener_url = _DEXSCREENER_PREFIX + token_address
 
             boost_display = f"{amount}⚡ (Total: {total_amount}⚡)" if total_amount > amount else f"{amount}⚡"
 
-            message = f"""
-🚨 **DETECTED Boost {boost_display}**
-
-**Token:** {token_name} (${token_symbol})
-**CA:** `{token_address}`
-**Platform:** {platform}
-
-📊 **Market Data**
-• **Age:** {age}
-• **Market Cap:** ${market_cap:,.0f}
-• **Price:** {price_str}
-• **Liquidity:** ${liquidity_usd:,.0f} ({liquidity_percentage:.1f}%)
-
-📈 **Transactions**
-• **5m:** {buys_5m} buys | {sells_5m} sells
-• **24h:** {buys_24h} buys | {sells_24h} sells
-
-🔗 [DexScreener]({dexscreener_url})
-"""
-
-            return message
-        except Exception as e:
-            logger.error(f"Error formatting message: {e}")
-
-            logger.error(traceback.format_exc())
+            return _TEMPLATE.format(
+                boost_display=boost_display,
+                token_name=html.escape(str(token_name)),
+                token_symbol=html.escape(str(token_symbol)),
+                token_address=html.escape(str(token_address)),
+                platform=html.escape(str(platform)),
+                age=age,
+                market_cap=market_cap,
+                price_str=price_str,
+                liquidity_usd=liquidity_usd,
+                liquidity_percentage=liquidity_percentage,
+                buys_5m=buys_5m,
+                sells_5m=sells_5m,
+                buys_24h=buys_24h,
+                sells_24h=sells_24h,
+                dexscreener_url=dexscreener_url,
+            )
+        except Exception:
+            logger.exception("Error formatting message")
             return None
\ No newline at end of file
@@ -1,11 +1,25 @@
-import requests
+import asyncio
+import httpx
+import orjson
 import time
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Optional
-from config import BOOST_API_URL, TARGET_CHAIN
+from cachetools import TTLCache
+from config import (
+    BOOST_API_URL,
+    TOKEN_API_URL,
+    TARGET_CHAIN,
+    MAX_CACHED_BOOSTS,
+    TOKEN_DETAILS_CACHE_SIZE,
+    TOKEN_DETAILS_CACHE_TTL,
+)
 
 logger = logging.getLogger(__name__)
 
+# DexScreener's tokens endpoint accepts at most 30 comma-separated addresses
+MAX_ADDRESSES_PER_REQUEST = 30
+
 class DexScreenerScanner:
     """
     Scanner that retrieves Solana token boost information from the DexScreener API
@@ -14,17 +28,37 @@ class DexScreenerScanner:
 
     def __init__(self):
         """
-        Initialize a requests.Session with custom headers and an empty cache
-        for already processed boost identifiers.
+        Initialize an httpx.AsyncClient with custom headers, HTTP/2 and a
+        keep-alive connection pool, plus an empty cache for already
+        processed boost identifiers.
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        })
-        self.seen_boost_ids = set()
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'application/json'
+            },
+            timeout=10.0,
+            # keepalive_expiry must outlive SCAN_INTERVAL, otherwise every
+            # scan cycle pays a fresh DNS lookup and TLS handshake (the
+            # httpx default is only 5 seconds)
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=300,
+            ),
+        )
+        # Insertion-ordered so eviction always drops the true oldest entry;
+        # keyed by (tokenAddress, amount, totalAmount) tuples
+        self.seen_boost_ids: OrderedDict[tuple, None] = OrderedDict()
+        self._details_cache = TTLCache(
+            maxsize=TOKEN_DETAILS_CACHE_SIZE, ttl=TOKEN_DETAILS_CACHE_TTL
+        )
+        # In-flight detail fetches, so concurrent lookups for the same
+        # address share one request instead of stampeding the API
+        self._inflight: Dict[str, asyncio.Task] = {}
 
-    def get_boosted_tokens(self) -> List[Dict]:
+    async def get_boosted_tokens(self) -> List[Dict]:
         """
         Fetch the latest boosted tokens from the DexScreener API, filter them for
         Solana, de-duplicate based on a composite key, and return a list of
@@ -35,9 +69,11 @@ class DexScreenerScanner:
             entries. Each dictionary contains the original boost payload.
         """
         try:
-            response = self.session.get(BOOST_API_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            response = await self.client.get(BOOST_API_URL)
+            if response.status_code != 200:
+                logger.warning(f"Boost API returned status {response.status_code}")
+                return []
+            data = orjson.loads(await response.aread())
 
             # Normalize the response format to a list of boosts
             if isinstance(data, list):
@@ -49,22 +85,32 @@ class DexScreenerScanner:
                 return []
 
             filtered_boosts: List[Dict] = []
+            target = TARGET_CHAIN
             for boost in boosts:
-                chain_id = boost.get('chainId', '').lower()
-                if chain_id != TARGET_CHAIN:
+                # The API consistently returns lowercase chain IDs, so the
+                # raw comparison hits first; .lower() is the rare-path fallback
+                chain_id = boost.get('chainId') or ''
+                if chain_id != target and chain_id.lower() != target:
                     continue
 
-                # Build a unique identifier for this boost event
-                token_address = boost.get('tokenAddress', '')
-                amount = boost.get('amount', 0)
-                total_amount = boost.get('totalAmount', 0)
-                boost_id = f"{token_address}_{amount}_{total_amount}"
+                # Build a unique identifier for this boost event; a tuple
+                # hashes faster than a formatted string and avoids the
+                # per-boost concatenation
+                boost_id = (
+                    boost.get('tokenAddress', ''),
+                    boost.get('amount', 0),
+                    boost.get('totalAmount', 0),
+                )
 
                 if boost_id in self.seen_boost_ids:
                     continue
 
                 filtered_boosts.append(boost)
-                self.seen_boost_ids.add(boost_id)
+                self.seen_boost_ids[boost_id] = None
+
+                # Evict inline so the cache stays strictly bounded
+                if len(self.seen_boost_ids) > MAX_CACHED_BOOSTS:
+                    self.seen_boost_ids.popitem(last=False)
 
             logger.info(f"Found {len(filtered_boosts)} new Solana boosts")
             return filtered_boosts
@@ -73,55 +119,99 @@ class DexScreenerScanner:
             logger.error(f"Error fetching boosts: {e}")
             return []
 
-    def get_token_details(self, token_address: str) -> Optional[Dict]:
+    @staticmethod
+    def _best_solana_pair(pairs: List[Dict]) -> Optional[Dict]:
+        """
+        Select the Solana pair with the highest USD liquidity from a list of
+        pair dictionaries.
+
+        Args:
+            pairs (List[Dict]): Pair objects as returned by the DexScreener API.
+
+        Returns:
+            Optional[Dict]: The most liquid Solana pair, or None if the list
+            contains no Solana pairs.
+        """
+        target = TARGET_CHAIN
+        solana_pairs = [
+            pair for pair in pairs
+            if (chain_id := pair.get('chainId') or '') == target
+            or chain_id.lower() == target
+        ]
+        if not solana_pairs:
+            return None
+        return max(
+            solana_pairs,
+            key=lambda x: float(x.get('liquidity', {}).get('usd', 0))
+        )
+
+    async def get_token_details(self, token_address: str, force_refresh: bool = False) -> Optional[Dict]:
         """
         Retrieve detailed information for a specific Solana token by querying
         DexScreener's search and token endpoints. The function prefers the
-        pair with the highest USD liquidity.
+        pair with the highest USD liquidity. Results are memoized per address
+        in a short-lived TTL cache, so repeated boosts of the same token
+        within the TTL window do not trigger additional HTTP calls.
 
         Args:
             token_address (str): The blockchain address of the token.
+            force_refresh (bool, optional): If True, bypass the TTL cache and
+                re-fetch from the API. Defaults to False.
 
         Returns:
             Optional[Dict]: A dictionary containing the most liquid Solana pair
             data for the token, or None if no relevant data could be found.
         """
+        if not force_refresh:
+            cached = self._details_cache.get(token_address)
+            if cached is not None:
+                return cached
+
+        # Coalesce concurrent lookups for the same address onto one fetch
+        task = self._inflight.get(token_address)
+        if task is not None:
+            return await task
+
+        task = asyncio.ensure_future(self._fetch_token_details(token_address))
+        self._inflight[token_address] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(token_address, None)
+
+    async def _fetch_token_details(self, token_address: str) -> Optional[Dict]:
+        """
+        Issue the actual search and fallback token-endpoint requests for a
+        single address, storing any result in the TTL cache.
+
+        Args:
+            token_address (str): The blockchain address of the token.
+
+        Returns:
+            Optional[Dict]: The most liquid Solana pair, or None.
+        """
         try:
             # Search endpoint
             search_url = f"https://api.dexscreener.com/latest/dex/search?q={token_address}"
-            response = self.session.get(search_url, timeout=5)
+            response = await self.client.get(search_url)
 
             if response.status_code == 200:
-                data = response.json()
-                if 'pairs' in data and len(data['pairs']) > 0:
-                    solana_pairs = [
-                        pair for pair in data['pairs']
-                        if pair.get('chainId', '').lower() == TARGET_CHAIN
-                    ]
-                    if solana_pairs:
-                        solana_pairs.sort(
-                            key=lambda x: float(x.get('liquidity', {}).get('usd', 0)),
-                            reverse=True
-                        )
-                        return solana_pairs[0]
+                data = orjson.loads(await response.aread())
+                best_pair = self._best_solana_pair(data.get('pairs') or [])
+                if best_pair is not None:
+                    self._details_cache[token_address] = best_pair
+                    return best_pair
 
             # Token-specific endpoint fallback
             token_url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-            response = self.session.get(token_url, timeout=5)
+            response = await self.client.get(token_url)
 
             if response.status_code == 200:
-                data = response.json()
-                if 'pairs' in data and len(data['pairs']) > 0:
-                    solana_pairs = [
-                        pair for pair in data['pairs']
-                        if pair.get('chainId', '').lower() == TARGET_CHAIN
-                    ]
-                    if solana_pairs:
-                        solana_pairs.sort(
-                            key=lambda x: float(x.get('liquidity', {}).get('usd', 0)),
-                            reverse=True
-                        )
-                        return solana_pairs[0]
+                data = orjson.loads(await response.aread())
+                best_pair = self._best_solana_pair(data.get('pairs') or [])
+                if best_pair is not None:
+                    self._details_cache[token_address] = best_pair
+                    return best_pair
 
             return None
 
@@ -129,19 +219,74 @@ class DexScreenerScanner:
             logger.error(f"Error fetching token details for {token_address}: {e}")
             return None
 
-    def cleanup_cache(self, max_size: int = 500) -> None:
+    async def get_token_details_bulk(self, addresses: List[str]) -> Dict[str, Dict]:
         """
-        Maintain a bounded cache of seen boost identifiers to prevent memory
-        growth. If the cache exceeds ``max_size``, it truncates to the most
-        recent entries.
+        Retrieve detailed information for multiple Solana tokens at once via
+        DexScreener's multi-address tokens endpoint, which accepts up to 30
+        comma-separated addresses per request. Results are stored in the same
+        TTL cache used by :meth:`get_token_details`.
 
         Args:
-            max_size (int, optional): Maximum number of identifiers to keep.
-                Defaults to 500.
-        """
-        if len(self.seen_boost_ids) > max_size:
-            ids_list = list(self.seen_boost_ids)
-            self.seen_boost_ids = set(ids_list[-max_size:])
-            logger.info(
-                f"Cleaned up boost cache. Now keeping {len(self.seen_boost_ids)} IDs."
-            )
\ No newline at end of file
+            addresses (List[str]): Blockchain addresses of the tokens.
+
+        Returns:
+            Dict[str, Dict]: Mapping of token address to the most liquid
+            Solana pair found for it. Addresses with no data are omitted.
+        """
+        results: Dict[str, Dict] = {}
+
+        # Serve what we can from the cache, only fetch the rest
+        to_fetch: List[str] = []
+        for address in addresses:
+            cached = self._details_cache.get(address)
+            if cached is not None:
+                results[address] = cached
+            elif address not in to_fetch:
+                to_fetch.append(address)
+
+        for i in range(0, len(to_fetch), MAX_ADDRESSES_PER_REQUEST):
+            chunk = to_fetch[i:i + MAX_ADDRESSES_PER_REQUEST]
+            try:
+                response = await self.client.get(
+                    f"{TOKEN_API_URL}/tokens/{','.join(chunk)}"
+                )
+                if response.status_code != 200:
+                    logger.warning(
+                        f"Bulk token lookup returned status {response.status_code}"
+                    )
+                    continue
+
+                data = orjson.loads(await response.aread())
+
+                # Group pairs by base-token address, then pick the best per token
+                pairs_by_address: Dict[str, List[Dict]] = {}
+                for pair in data.get('pairs') or []:
+                    base_address = pair.get('baseToken', {}).get('address')
+                    if base_address:
+                        pairs_by_address.setdefault(base_address, []).append(pair)
+
+                for address, pairs in pairs_by_address.items():
+                    best_pair = self._best_solana_pair(pairs)
+                    if best_pair is not None:
+                        self._details_cache[address] = best_pair
+                        results[address] = best_pair
+
+            except Exception as e:
+                logger.error(f"Error fetching bulk token details: {e}")
+
+        return results
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP client and drain the connection pool.
+        Should be awaited once during bot shutdown.
+        """
+        await self.client.aclose()
+
+    def cleanup_cache(self) -> None:
+        """
+        Periodic cache maintenance. The seen-boost cache is now bounded
+        inline at insertion time, so this only drops expired token-detail
+        entries from the TTL cache.
+        """
+        self._details_cache.expire()